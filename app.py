@@ -1,84 +1,122 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+
+from wacc_module import calculate_wacc, wacc_batch
+
+INTRO_TEXT = """
+This calculator determines the Weighted Average Cost of Capital (WACC) using the equity and debt structure of a company.
+Enter the values below and press Calculate to update the results.
+"""
+
+FORMULA_TEXT = "Formula: (E/V × Re) + (D/V × Rd × (1 - Tax Rate))"
 
 st.set_page_config(page_title="WACC Calculator", page_icon="🧮")
 
 st.title("🧮 WACC Calculator")
 
-st.write("""
-This calculator determines the Weighted Average Cost of Capital (WACC) using the equity and debt structure of a company.
-Enter the values below and view the calculated results instantly.
-""")
+st.write(INTRO_TEXT)
 
 # ─────────── Inputs ─────────── #
 
 st.subheader("Inputs")
 
-equity_value = st.number_input("Equity Value (£)", min_value=0.0, value=12000.0)
-debt_value = st.number_input("Debt Value (£)", min_value=0.0, value=2000.0)
-cost_of_equity = st.number_input("Cost of Equity (%)", min_value=0.0, value=10.0, step=0.1)
-cost_of_debt = st.number_input("Cost of Debt (%)", min_value=0.0, value=6.7, step=0.1)
-tax_rate = st.number_input("Tax Rate (%)", min_value=0.0, max_value=100.0, value=25.0)
+# Inputs are batched in a form so tuning several values triggers one rerun
+with st.form("inputs"):
+    equity_value = st.number_input("Equity Value (£)", min_value=0.0, value=12000.0)
+    debt_value = st.number_input("Debt Value (£)", min_value=0.0, value=2000.0)
+    cost_of_equity = st.number_input("Cost of Equity (%)", min_value=0.0, value=10.0, step=0.1)
+    cost_of_debt = st.number_input("Cost of Debt (%)", min_value=0.0, value=6.7, step=0.1)
+    tax_rate = st.number_input("Tax Rate (%)", min_value=0.0, max_value=100.0, value=25.0)
+    st.form_submit_button("Calculate")
 
 # Convert %
 cost_of_equity /= 100
 cost_of_debt /= 100
 tax_rate /= 100
 
-# ─────────── WACC Calculation ─────────── #
-
-total_value = equity_value + debt_value
-
-equity_weight = equity_value / total_value
-debt_weight = debt_value / total_value
+if equity_value + debt_value == 0:
+    st.warning("Equity + Debt cannot be zero; enter at least one value to weight the costs.")
+    st.stop()
 
-weighted_cost_equity = equity_weight * cost_of_equity
-weighted_cost_debt = debt_weight * cost_of_debt * (1 - tax_rate)
-
-wacc = weighted_cost_equity + weighted_cost_debt
+# ─────────── WACC Calculation ─────────── #
 
-# ─────────── Results Table ─────────── #
+COMPONENTS = ("Equity", "Debt")
+
+def compute_wacc_table(result):
+    """Build the WACC summary table from a `wacc_module.calculate_wacc` result."""
+    wacc_df = pd.DataFrame({
+        "Type": COMPONENTS,
+        "Amount (£)": [result["equity_value"], result["debt_value"]],
+        "Weight": [result["equity_weight"], result["debt_weight"]],
+        "Cost_%": [result["cost_of_equity"] * 100, result["cost_of_debt"] * 100],
+        "Weighted_Cost": [result["equity_weighted_cost"], result["debt_weighted_cost"]],
+        "Total_Cost": [float("nan"), result["wacc_percent"]]
+    })
 
-wacc_df = pd.DataFrame({
-    "Type": ["Equity", "Debt"],
-    "Amount (£)": [equity_value, debt_value],
-    "Weight": [equity_weight, debt_weight],
-    "Cost_%": [cost_of_equity * 100, cost_of_debt * 100],
-    "Weighted_Cost": [weighted_cost_equity, weighted_cost_debt],
-    "Total_Cost": ["", ""]
-})
+    return wacc_df
 
-# Add WACC to Total_Cost row
-wacc_df.loc[1, "Total_Cost"] = f"{wacc*100:.3f}%"
+inputs = (equity_value, debt_value, cost_of_equity, cost_of_debt, tax_rate)
+result = calculate_wacc(*inputs)
 
 # ─────────── Column Shading Style ─────────── #
 
-def style_pipeline(df):
-    colors = {
-        "Cost_%": "#FFF7CC",         # light yellow
-        "Weighted_Cost": "#E6F2FF",  # light blue
-        "Total_Cost": "#E8FFE6"      # light green
-    }
+COLUMN_COLORS = {
+    "Cost_%": "#FFF7CC",         # light yellow
+    "Weighted_Cost": "#E6F2FF",  # light blue
+    "Total_Cost": "#E8FFE6"      # light green
+}
 
+def style_pipeline(df):
     def highlight(col):
-        return [f'background-color: {colors.get(col.name, "")}'] * len(col)
+        return [f'background-color: {COLUMN_COLORS.get(col.name, "")}'] * len(col)
 
     styled = df.style.apply(highlight)
     styled = styled.format({
         "Weight": "{:.3f}",
         "Cost_%": "{:.2f}",
-        "Weighted_Cost": "{:.3f}"
-    })
+        "Weighted_Cost": "{:.3f}",
+        "Total_Cost": "{:.3f}%"
+    }, na_rep="")
 
     return styled
 
+@st.cache_data(show_spinner=False, max_entries=32)
+def render_wacc_table(result):
+    """Styled summary table as HTML; cached on the result dict so reruns skip pandas and Styler."""
+    table = compute_wacc_table(result)
+    return style_pipeline(table).set_table_attributes('style="width: 100%"').to_html()
+
 # ─────────── Output ─────────── #
 
 st.subheader("WACC Summary Table")
-st.dataframe(style_pipeline(wacc_df), use_container_width=True)
+st.html(render_wacc_table(result))
+
+st.metric("Final WACC", f"{result['wacc_percent']:.3f}%")
+
+st.caption(FORMULA_TEXT)
+
+# ─────────── Sensitivity ─────────── #
+
+SWEEP_INPUTS = {
+    "Tax Rate (%)": "tax_rate",
+    "Cost of Debt (%)": "cost_of_debt",
+    "Cost of Equity (%)": "cost_of_equity",
+}
 
-st.metric("Final WACC", f"{wacc*100:.3f}%")
+st.subheader("Sensitivity")
 
-st.caption("Formula: (E/V × Re) + (D/V × Rd × (1 - Tax Rate))")
+sweep_label = st.selectbox("Vary", tuple(SWEEP_INPUTS))
+sweep_arg = SWEEP_INPUTS[sweep_label]
 
+scenario = dict(zip(("equity_value", "debt_value", "cost_of_equity", "cost_of_debt", "tax_rate"), inputs))
+# Sweep tax across its full range; costs from zero to twice the current input
+sweep_max = 100.0 if sweep_arg == "tax_rate" else max(scenario[sweep_arg] * 200, 1.0)
+sweep_values = np.linspace(0.0, sweep_max, 201)
+scenario[sweep_arg] = sweep_values / 100
 
+sweep_df = pd.DataFrame(
+    {"WACC (%)": wacc_batch(**scenario) * 100},
+    index=pd.Index(sweep_values, name=sweep_label)
+)
+st.line_chart(sweep_df)
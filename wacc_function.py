@@ -7,22 +7,29 @@ Author: A. McBride
 Generated with ChatGPT (GPT-5) under user supervision.
 """
 
+import wacc_module
+
+
+def ke_capm(rf, beta, rm):
+    """Cost of equity from CAPM: rf + beta × (rm − rf)."""
+    return rf + beta * (rm - rf)
+
+
+def ke_gordon(d1, p0, g):
+    """Cost of equity from the Gordon growth model: D1 / P0 + g."""
+    return (d1 / p0) + g
+
+
 def calculate_cost_of_equity(method="direct", **kwargs):
     """Calculate cost of equity using Direct, CAPM, or Gordon models."""
     if method == "direct":
         return kwargs.get("cost_of_equity")
 
     elif method == "capm":
-        rf = kwargs.get("risk_free_rate")
-        beta = kwargs.get("beta")
-        rm = kwargs.get("market_return")
-        return rf + beta * (rm - rf)
+        return ke_capm(kwargs.get("risk_free_rate"), kwargs.get("beta"), kwargs.get("market_return"))
 
     elif method == "gordon":
-        d1 = kwargs.get("dividend_next")
-        p0 = kwargs.get("price_now")
-        g = kwargs.get("growth_rate")
-        return (d1 / p0) + g
+        return ke_gordon(kwargs.get("dividend_next"), kwargs.get("price_now"), kwargs.get("growth_rate"))
 
     else:
         raise ValueError("Invalid method. Choose 'direct', 'capm', or 'gordon'.")
@@ -37,16 +44,12 @@ def calculate_wacc(
     equity_method: str = "direct",
     **kwargs
 ) -> float:
-    """Compute Weighted Average Cost of Capital (WACC) as a percentage."""
+    """Compute Weighted Average Cost of Capital (WACC) as an unrounded percentage."""
     ke = calculate_cost_of_equity(
         method=equity_method,
         cost_of_equity=cost_of_equity,
         **kwargs
     )
 
-    total_value = equity_value + debt_value
-    w_e = equity_value / total_value
-    w_d = debt_value / total_value
-
-    wacc = (w_e * ke) + (w_d * cost_of_debt * (1 - tax_rate))
-    return round(wacc * 100, 2)
\ No newline at end of file
+    wacc = wacc_module.calculate_wacc_scalar(equity_value, debt_value, ke, cost_of_debt, tax_rate)
+    return wacc * 100.0
@@ -6,6 +6,24 @@ to compute the Weighted Average Cost of Capital (WACC)
 with no user interface dependencies.
 """
 
+import numpy as np
+
+
+def _weights_and_wacc(equity_value, debt_value, cost_of_equity, cost_of_debt, tax_rate):
+    """Return (w_e, w_d, weighted_ke, weighted_kd, wacc) from one reciprocal of the total value."""
+    total_value = equity_value + debt_value
+    if total_value == 0:
+        raise ValueError("Equity + Debt cannot be zero.")
+
+    inv_total = 1.0 / total_value
+    w_e = equity_value * inv_total
+    w_d = debt_value * inv_total
+
+    weighted_ke = w_e * cost_of_equity
+    weighted_kd = w_d * (cost_of_debt * (1.0 - tax_rate))
+    return w_e, w_d, weighted_ke, weighted_kd, weighted_ke + weighted_kd
+
+
 def calculate_wacc(equity_value, debt_value, cost_of_equity, cost_of_debt, tax_rate):
     """
     Weighted Average Cost of Capital (WACC)
@@ -26,17 +44,14 @@ def calculate_wacc(equity_value, debt_value, cost_of_equity, cost_of_debt, tax_r
     Returns
     -------
     dict
-        Dictionary containing the component weights and total WACC (%).
+        Dictionary containing the component weights, each component's
+        weighted cost (as a decimal) and total WACC (%). Values are
+        unrounded; format them for display (e.g., f"{wacc_percent:.2f}").
     """
 
-    total_value = equity_value + debt_value
-    if total_value == 0:
-        raise ValueError("Equity + Debt cannot be zero.")
-
-    w_e = equity_value / total_value
-    w_d = debt_value / total_value
-
-    wacc = (w_e * cost_of_equity) + (w_d * cost_of_debt * (1 - tax_rate))
+    w_e, w_d, weighted_ke, weighted_kd, wacc = _weights_and_wacc(
+        equity_value, debt_value, cost_of_equity, cost_of_debt, tax_rate
+    )
 
     return {
         "equity_value": equity_value,
@@ -44,7 +59,61 @@ def calculate_wacc(equity_value, debt_value, cost_of_equity, cost_of_debt, tax_r
         "cost_of_equity": cost_of_equity,
         "cost_of_debt": cost_of_debt,
         "tax_rate": tax_rate,
-        "equity_weight": round(w_e, 4),
-        "debt_weight": round(w_d, 4),
-        "wacc_percent": round(wacc * 100, 2)
+        "equity_weight": w_e,
+        "debt_weight": w_d,
+        "equity_weighted_cost": weighted_ke,
+        "debt_weighted_cost": weighted_kd,
+        "wacc_percent": wacc * 100.0
     }
+
+
+def calculate_wacc_scalar(equity_value, debt_value, cost_of_equity, cost_of_debt, tax_rate):
+    """
+    WACC as a plain float, without building the result dictionary.
+
+    Parameters
+    ----------
+    equity_value, debt_value, cost_of_equity, cost_of_debt, tax_rate : float
+        Same meaning and units as in `calculate_wacc`.
+
+    Returns
+    -------
+    float
+        WACC as a decimal (e.g., 0.0929 for 9.29%).
+    """
+
+    return _weights_and_wacc(equity_value, debt_value, cost_of_equity, cost_of_debt, tax_rate)[4]
+
+
+def wacc_batch(equity_value, debt_value, cost_of_equity, cost_of_debt, tax_rate):
+    """
+    Vectorised WACC across many scenarios in a single NumPy call.
+
+    Parameters
+    ----------
+    equity_value, debt_value, cost_of_equity, cost_of_debt, tax_rate : float or array_like
+        Same meaning and units as in `calculate_wacc`. Each argument may be
+        a scalar or a 1-D array; arrays must share one length N and scalars
+        are broadcast across them.
+
+    Returns
+    -------
+    numpy.ndarray
+        WACC for each scenario as a decimal.
+    """
+
+    equity_value, debt_value, cost_of_equity, cost_of_debt, tax_rate = (
+        np.asarray(x, dtype=float)
+        for x in (equity_value, debt_value, cost_of_equity, cost_of_debt, tax_rate)
+    )
+
+    total_value = equity_value + debt_value
+    if np.any(total_value == 0):
+        raise ValueError("Equity + Debt cannot be zero.")
+
+    inv_total = 1.0 / total_value
+    w_e = equity_value * inv_total
+    w_d = debt_value * inv_total
+
+    # Same operation order as calculate_wacc so the two agree to the last bit
+    return (w_e * cost_of_equity) + (w_d * (cost_of_debt * (1.0 - tax_rate)))